@@ -0,0 +1,336 @@
+import pytest
+
+from qtpy import QtCore, QtWidgets
+
+from ...widgets import designer_settings
+from ...widgets.designer_settings import (BasicSettingsEditor, DictionaryTable,
+                                          PropertyMacroTable, StringListTable,
+                                          StringTableModel)
+from ...widgets.embedded_display import PyDMEmbeddedDisplay
+from ...widgets.label import PyDMLabel
+from ...widgets.related_display_button import PyDMRelatedDisplayButton
+
+
+@pytest.fixture
+def dictionary_table(qtbot):
+    table = DictionaryTable({"A": "1", " B ": "2"})
+    qtbot.addWidget(table)
+    return table
+
+
+@pytest.fixture
+def clipboard(monkeypatch):
+    """Stand-in for the system clipboard used by the context menu."""
+    contents = {"text": ""}
+
+    def copy_to_clipboard(text):
+        contents["text"] = text
+
+    monkeypatch.setattr(designer_settings, "copy_to_clipboard",
+                        copy_to_clipboard)
+    monkeypatch.setattr(designer_settings, "get_clipboard_text",
+                        lambda: contents["text"])
+    return contents
+
+
+@pytest.fixture
+def updated_properties(monkeypatch):
+    """Record property updates instead of applying them."""
+    updates = []
+
+    def update_property_for_widget(widget, name, value):
+        updates.append((name, value))
+
+    monkeypatch.setattr(designer_settings, "update_property_for_widget",
+                        update_property_for_widget)
+    return updates
+
+
+def select_menu_index(table, row, column):
+    """Point the table context menu at the given cell."""
+    index = table.model().index(row, column)
+    table._menu_index = QtCore.QPersistentModelIndex(index)
+
+
+@pytest.mark.parametrize(
+    "dictionary, expected",
+    [
+        ({"A": "1", " B ": "2"}, {"A": "1", "B": "2"}),
+        ({}, {}),
+        (None, {}),
+    ]
+)
+def test_dictionary_table_round_trip(qtbot, dictionary, expected):
+    """
+    Test that the dictionary set on a DictionaryTable is read back with
+    stripped keys.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    dictionary : dict
+        The dictionary to set
+    expected : dict
+        The dictionary expected to be read back
+    """
+    table = DictionaryTable(dictionary)
+    qtbot.addWidget(table)
+    assert table.dictionary == expected
+    assert table.model().rowCount() == len(expected)
+
+    table.dictionary = {"C": "3"}
+    assert table.dictionary == {"C": "3"}
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["a", " b "], ["a", "b"]),
+        ([], []),
+        (None, []),
+    ]
+)
+def test_string_list_table_round_trip(qtbot, values, expected):
+    """
+    Test that the values given to a StringListTable constructor are applied
+    and read back stripped.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    values : list
+        The values to construct the table with
+    expected : list
+        The values expected to be read back
+    """
+    table = StringListTable(values)
+    qtbot.addWidget(table)
+    assert table.values == expected
+
+    table.values = ["c"]
+    assert table.values == ["c"]
+
+
+def test_string_table_model_insert_remove_rows(qtbot):
+    """
+    Test inserting and removing rows of the StringTableModel, including
+    out-of-range requests.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    """
+    model = StringTableModel(("Key", "Value"))
+    model.rows = [("A", "1")]
+
+    assert model.insertRows(1, 2)
+    assert model.rows == [["A", "1"], ["", ""], ["", ""]]
+    assert model.insertRows(0, 1)
+    assert model.rows[0] == ["", ""]
+    assert model.rowCount() == 4
+
+    assert not model.insertRows(5, 1)
+    assert not model.insertRows(0, 0)
+    assert not model.insertRows(-1, 1)
+
+    assert model.removeRows(0, 2)
+    assert model.rows == [["", ""], ["", ""]]
+
+    assert not model.removeRows(5, 1)
+    assert not model.removeRows(1, 2)
+    assert not model.removeRows(0, 0)
+    assert not model.removeRows(-1, 1)
+    assert model.rowCount() == 2
+
+
+def test_string_table_model_set_data(qtbot):
+    """
+    Test editing the StringTableModel data.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    """
+    model = StringTableModel(("Key", "Value"))
+    model.rows = [("A", "1")]
+    index = model.index(0, 1)
+
+    with qtbot.waitSignal(model.dataChanged):
+        assert model.setData(index, "2")
+    assert model.data(index) == "2"
+    assert model.data(index, QtCore.Qt.EditRole) == "2"
+    assert model.rows == [["A", "2"]]
+
+    assert not model.setData(index, "3", QtCore.Qt.DisplayRole)
+    assert not model.setData(QtCore.QModelIndex(), "3")
+    assert model.rows == [["A", "2"]]
+
+
+def test_dictionary_table_copy_paste(dictionary_table, clipboard):
+    """
+    Test the Copy and Paste context menu actions.
+
+    Parameters
+    ----------
+    dictionary_table : fixture
+        DictionaryTable holding two entries
+    clipboard : fixture
+        Stand-in for the system clipboard
+    """
+    select_menu_index(dictionary_table, 0, 1)
+    dictionary_table._copy_item()
+    assert clipboard["text"] == "1"
+
+    clipboard["text"] = "pasted"
+    select_menu_index(dictionary_table, 1, 1)
+    dictionary_table._paste_item()
+    assert dictionary_table.dictionary == {"A": "1", "B": "pasted"}
+
+
+def test_dictionary_table_add_delete_row(dictionary_table):
+    """
+    Test the Add row and Delete row context menu actions.
+
+    Parameters
+    ----------
+    dictionary_table : fixture
+        DictionaryTable holding two entries
+    """
+    dictionary_table._add_row()
+    assert dictionary_table.model().rows[-1] == ["", ""]
+    assert dictionary_table.dictionary == {"A": "1", "B": "2", "": ""}
+
+    select_menu_index(dictionary_table, 0, 0)
+    dictionary_table._delete_row()
+    assert dictionary_table.dictionary == {"B": "2", "": ""}
+
+
+def test_context_menu_actions_without_item(dictionary_table, clipboard):
+    """
+    Test that the cell actions do nothing without a cell under the cursor.
+
+    Parameters
+    ----------
+    dictionary_table : fixture
+        DictionaryTable holding two entries
+    clipboard : fixture
+        Stand-in for the system clipboard
+    """
+    clipboard["text"] = "pasted"
+    dictionary_table._menu_index = QtCore.QPersistentModelIndex()
+    dictionary_table._copy_item()
+    dictionary_table._paste_item()
+    dictionary_table._delete_row()
+    assert clipboard["text"] == "pasted"
+    assert dictionary_table.dictionary == {"A": "1", "B": "2"}
+
+
+def test_string_table_sections(qtbot):
+    """
+    Test that the last column fills the table and rows fit a cell editor.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    """
+    table = StringListTable(["/a/long/path/to/a/display.ui"])
+    qtbot.addWidget(table)
+    assert table.horizontalHeader().stretchLastSection()
+
+    editor_height = QtWidgets.QLineEdit().sizeHint().height()
+    assert table.verticalHeader().defaultSectionSize() >= editor_height
+
+
+@pytest.mark.parametrize("widget_cls", [PyDMEmbeddedDisplay,
+                                        PyDMRelatedDisplayButton,
+                                        PyDMLabel])
+def test_save_without_changes(qtbot, updated_properties, widget_cls):
+    """
+    Test that saving the settings editor without edits updates nothing.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    updated_properties : fixture
+        Recorded property updates
+    widget_cls : type
+        The PyDM widget class to edit
+    """
+    widget = widget_cls()
+    qtbot.addWidget(widget)
+    if widget_cls is PyDMEmbeddedDisplay:
+        widget.macros = "A=B"
+
+    editor = BasicSettingsEditor(widget)
+    qtbot.addWidget(editor)
+    editor.save_changes()
+    assert updated_properties == []
+
+
+def test_save_edited_macros(qtbot, updated_properties):
+    """
+    Test that an edited macro table is saved as JSON.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    updated_properties : fixture
+        Recorded property updates
+    """
+    widget = PyDMEmbeddedDisplay()
+    qtbot.addWidget(widget)
+    widget.macros = "A=B"
+
+    editor = BasicSettingsEditor(widget)
+    qtbot.addWidget(editor)
+    macro_table, = [helper for helper in editor.property_widgets
+                    if isinstance(helper, PropertyMacroTable)]
+    macro_table.dictionary = {"A": "C"}
+    editor.save_changes()
+    assert updated_properties == [("macros", '{"A": "C"}')]
+
+
+@pytest.mark.parametrize(
+    "macros, dictionary",
+    [
+        ("A=B, C = D", {"A": "B", "C": "D"}),
+        ('{"A": 1, "B": true}', {"A": "1", "B": "True"}),
+    ]
+)
+def test_unchanged_macros_keep_original_string(qtbot, macros, dictionary):
+    """
+    Test that an unchanged macro table saves the original macro string,
+    including JSON macros with non-string values.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt window for widget test
+    macros : str
+        The macro string set on the widget
+    dictionary : dict
+        The dictionary expected in the macro table
+    """
+    widget = PyDMEmbeddedDisplay()
+    qtbot.addWidget(widget)
+    widget.macros = macros
+
+    macro_table = PropertyMacroTable(property_widget=widget,
+                                     property_name="macros")
+    qtbot.addWidget(macro_table)
+    assert macro_table.dictionary == dictionary
+    assert macro_table.saved_value == macros
+
+
+def test_parse_macro_string_cache_is_not_shared():
+    """Test that modifying a parsed macro dictionary leaves the cache intact."""
+    macros = designer_settings._parse_macro_string("A=B")
+    macros["A"] = "C"
+    assert designer_settings._parse_macro_string("A=B") == {"A": "B"}
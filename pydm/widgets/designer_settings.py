@@ -1,15 +1,17 @@
-import json
+import functools
+import itertools
 import logging
 import re
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from qtpy import QtCore, QtDesigner, QtWidgets
 
 from ..utilities import copy_to_clipboard, get_clipboard_text
-from ..utilities.macro import parse_macro_string
 
 logger = logging.getLogger(__name__)
 
+_CAMEL_CASE_RE = re.compile("(PyDM|.)([A-Z])")
+
 
 def update_property_for_widget(widget: QtWidgets.QWidget, name: str, value):
     """Update a Property for the given widget in the designer."""
@@ -21,148 +23,195 @@ def update_property_for_widget(widget: QtWidgets.QWidget, name: str, value):
         setattr(widget, name, value)
 
 
-class DictionaryTable(QtWidgets.QTableWidget):
-    def __init__(self, dictionary=None, *args, parent=None, **kwargs):
+class StringTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model holding rows of editable strings.
+
+    Parameters
+    ----------
+    column_names : tuple of str
+        The header names, one per column.
+    """
+
+    def __init__(self, column_names, parent=None):
+        super().__init__(parent=parent)
+        self._column_names = tuple(column_names)
+        self._rows = []
+
+    @property
+    def rows(self) -> List[List[str]]:
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows):
+        new_rows = [list(row) for row in rows]
+        self.beginResetModel()
+        self._rows = new_rows
+        self.endResetModel()
+
+    # QAbstractItemModel Implementation
+    def flags(self, index):
+        return (
+            QtCore.Qt.ItemIsSelectable
+            | QtCore.Qt.ItemIsEnabled
+            | QtCore.Qt.ItemIsEditable
+        )
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=None):
+        return len(self._column_names)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._column_names[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return QtCore.QVariant()
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self._rows[index.row()][index.column()]
+        return QtCore.QVariant()
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()):
+        if count < 1 or row < 0 or row > len(self._rows):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        for _ in range(count):
+            self._rows.insert(row, [""] * self.columnCount())
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        if count < 1 or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
+class _StringTable(QtWidgets.QTableView):
+    """Base for the editable string tables, with a copy/paste context menu."""
+
+    _column_names_ = ()
+
+    def __init__(self, *args, parent=None, **kwargs):
         super().__init__(*args, parent=parent, **kwargs)
 
-        self.setColumnCount(2)
+        self._model = StringTableModel(self._column_names_, parent=self)
+        self.setModel(self._model)
         self.setMinimumSize(300, 150)
-        self.setHorizontalHeaderLabels(["Key", "Value"])
+
+        # Fixed section sizes avoid measuring every cell on each update
+        horizontal_header = self.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        horizontal_header.setDefaultSectionSize(150)
+        horizontal_header.setStretchLastSection(True)
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        # Leave room for the inline line edit used while editing a cell
+        vertical_header.setDefaultSectionSize(max(
+            vertical_header.defaultSectionSize(),
+            QtWidgets.QLineEdit().sizeHint().height(),
+        ))
+
+        # The context menu is built once and retargeted on each request
+        self._menu_index = QtCore.QPersistentModelIndex()
+        self.menu = QtWidgets.QMenu(self)
+        self._copy_action = self.menu.addAction("&Copy")
+        self._copy_action.triggered.connect(self._copy_item)
+        self._paste_action = self.menu.addAction("&Paste")
+        self._paste_action.triggered.connect(self._paste_item)
+        self._delete_row_action = self.menu.addAction("&Delete row...")
+        self._delete_row_action.triggered.connect(self._delete_row)
+        self.menu.addSeparator()
+        self._add_row_action = self.menu.addAction("&Add row...")
+        self._add_row_action.triggered.connect(self._add_row)
 
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._context_menu)
-        self.dictionary = dictionary
 
     def _context_menu(self, pos):
-        self.menu = QtWidgets.QMenu(self)
-        item = self.itemAt(pos)
-        if item is not None:
-            def copy(*_):
-                copy_to_clipboard(item.text())
+        index = self.indexAt(pos)
+        self._menu_index = QtCore.QPersistentModelIndex(index)
+        has_item = index.isValid()
+        for action in (self._copy_action, self._paste_action,
+                       self._delete_row_action):
+            action.setVisible(has_item)
 
-            copy_action = self.menu.addAction(f"&Copy: {item.text()}")
-            copy_action.triggered.connect(copy)
+        if has_item:
+            self._copy_action.setText(f"&Copy: {index.data()}")
 
-            clipboard_text = get_clipboard_text() or ""
+        self.menu.exec_(self.mapToGlobal(pos))
 
-            def paste(*_):
-                item.setText(clipboard_text)
+    def _copy_item(self, *_):
+        if self._menu_index.isValid():
+            copy_to_clipboard(self._menu_index.data())
 
-            paste_action = self.menu.addAction(
-                f"&Paste: {clipboard_text[:100]}"
+    def _paste_item(self, *_):
+        if self._menu_index.isValid():
+            index = self._model.index(
+                self._menu_index.row(), self._menu_index.column()
             )
-            paste_action.triggered.connect(paste)
+            self._model.setData(index, get_clipboard_text() or "")
 
-            def delete_row(*_):
-                self.removeRow(item.row())
+    def _delete_row(self, *_):
+        if self._menu_index.isValid():
+            self._model.removeRows(self._menu_index.row(), 1)
 
-            delete_row_action = self.menu.addAction("&Delete row...")
-            delete_row_action.triggered.connect(delete_row)
+    def _add_row(self, *_):
+        self._model.insertRows(self._model.rowCount(), 1)
 
-        self.menu.addSeparator()
 
-        def add_row(*_):
-            row = self.rowCount()
-            self.setRowCount(row + 1)
-            self.setItem(row, 0, QtWidgets.QTableWidgetItem(""))
-            self.setItem(row, 1, QtWidgets.QTableWidgetItem(""))
+class DictionaryTable(_StringTable):
+    _column_names_ = ("Key", "Value")
 
-        add_row_action = self.menu.addAction("&Add row...")
-        add_row_action.triggered.connect(add_row)
-        self.menu.exec_(self.mapToGlobal(pos))
+    def __init__(self, dictionary=None, *args, parent=None, **kwargs):
+        super().__init__(*args, parent=parent, **kwargs)
+        self.dictionary = dictionary
 
     @property
     def dictionary(self) -> dict:
-        items = [
-            (self.item(row, 0), self.item(row, 1))
-            for row in range(self.rowCount())
-        ]
-        key_value_pairs = [
-            (key.text() if key else "", value.text() if value else "")
-            for key, value in items
-        ]
         return {
             key.strip(): value
-            for key, value in key_value_pairs
+            for key, value in self._model.rows
         }
 
     @dictionary.setter
     def dictionary(self, dct):
         dct = dct or {}
-        self.setRowCount(len(dct))
-        for row, (key, value) in enumerate(dct.items()):
-            self.setItem(row, 0, QtWidgets.QTableWidgetItem(key))
-            self.setItem(row, 1, QtWidgets.QTableWidgetItem(value))
+        self._model.rows = [
+            (str(key), str(value)) for key, value in dct.items()
+        ]
 
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
 
+class StringListTable(_StringTable):
+    _column_names_ = ("Value", )
 
-class StringListTable(QtWidgets.QTableWidget):
     def __init__(self, values=None, *args, parent=None, **kwargs):
         super().__init__(*args, parent=parent, **kwargs)
-
-        self.setColumnCount(1)
-        self.setMinimumSize(300, 150)
-        self.setHorizontalHeaderLabels(["Value"])
-
-        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._context_menu)
-        self.values
-
-    def _context_menu(self, pos):
-        self.menu = QtWidgets.QMenu(self)
-        item = self.itemAt(pos)
-        if item is not None:
-            def copy(*_):
-                copy_to_clipboard(item.text())
-
-            copy_action = self.menu.addAction(f"&Copy: {item.text()}")
-            copy_action.triggered.connect(copy)
-
-            clipboard_text = get_clipboard_text()
-
-            def paste(*_):
-                item.setText(clipboard_text)
-
-            paste_action = self.menu.addAction(f"&Paste: {clipboard_text}")
-            paste_action.triggered.connect(paste)
-
-            def delete_row(*_):
-                self.removeRow(item.row())
-
-            delete_row_action = self.menu.addAction("&Delete row...")
-            delete_row_action.triggered.connect(delete_row)
-
-        self.menu.addSeparator()
-
-        def add_row(*_):
-            row = self.rowCount()
-            self.setRowCount(row + 1)
-            self.setItem(row, 0, QtWidgets.QTableWidgetItem(""))
-
-        add_row_action = self.menu.addAction("&Add row...")
-        add_row_action.triggered.connect(add_row)
-        self.menu.exec_(self.mapToGlobal(pos))
+        self.values = values
 
     @property
     def values(self) -> list:
-        items = [self.item(row, 0) for row in range(self.rowCount())]
-        return [
-            item.text().strip()
-            for item in items
-            if item is not None
-        ]
+        return [value.strip() for value, in self._model.rows]
 
     @values.setter
     def values(self, values):
         values = values or []
-        self.setRowCount(len(values))
-        for row, value in enumerate(values):
-            self.setItem(row, 0, QtWidgets.QTableWidgetItem(str(value)))
-
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
+        self._model.rows = [(str(value), ) for value in values]
 
 
 class _PropertyHelper:
@@ -170,6 +219,7 @@ class _PropertyHelper:
         super().__init__(*args, **kwargs)
         self._property_name = property_name
         self._property_widget = property_widget
+        self._initial_value = None
 
         value = None
         try:
@@ -179,6 +229,8 @@ class _PropertyHelper:
                 attr=self._property_name,
                 value=value,
             )
+            # Compare against the helper's own normalized value on save
+            self._initial_value = self.saved_value
         except Exception:
             logger.exception(
                 "Failed to set helper widget %s state from %s=%s",
@@ -197,11 +249,11 @@ class _PropertyHelper:
 
     @property
     def saved_value(self) -> Optional[Any]:
-        raise None
+        return None
 
     def save_settings(self):
         value = self.saved_value
-        if value is not None:
+        if value is not None and value != self._initial_value:
             update_property_for_widget(
                 self._property_widget,
                 self._property_name,
@@ -222,10 +274,6 @@ class PropertyRuleEditor(_PropertyHelper, QtWidgets.QPushButton):
         self._rules_editor = RulesEditor(self._property_widget, parent=self)
         self._rules_editor.exec_()
 
-    @property
-    def saved_value(self) -> Optional[str]:
-        return None
-
 
 class PropertyCheckbox(_PropertyHelper, QtWidgets.QCheckBox):
     def set_value_from_widget(self, widget, attr, value):
@@ -254,18 +302,41 @@ class PropertyIntSpinBox(_PropertyHelper, QtWidgets.QSpinBox):
         return self.value()
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_parse_macro_string(macro_string: str) -> dict:
+    from ..utilities.macro import parse_macro_string
+    return parse_macro_string(macro_string)
+
+
+def _parse_macro_string(macro_string: str) -> dict:
+    """Cached parse_macro_string, returning a copy the caller may modify."""
+    return dict(_cached_parse_macro_string(macro_string))
+
+
 class PropertyMacroTable(_PropertyHelper, DictionaryTable):
+    _initial_dictionary = None
+    _initial_macro_string = None
+
     def set_value_from_widget(self, widget, attr, value):
         try:
-            macros = parse_macro_string(value or "")
+            macros = _parse_macro_string(str(value or ""))
         except Exception:
             logger.exception("Failed to parse macro string: %r", value)
         else:
+            self._initial_macro_string = value
             self.dictionary = macros
+            # Read back so values are normalized the same way as on save
+            self._initial_dictionary = self.dictionary
 
     @property
     def saved_value(self) -> Optional[str]:
-        return json.dumps(self.dictionary)
+        import json
+
+        dictionary = self.dictionary
+        if dictionary == self._initial_dictionary:
+            # Unchanged; keep the original macro string as-is.
+            return self._initial_macro_string
+        return json.dumps(dictionary)
 
 
 class PropertyStringList(_PropertyHelper, StringListTable):
@@ -277,17 +348,32 @@ class PropertyStringList(_PropertyHelper, StringListTable):
         return self.values
 
 
-def get_qt_properties(cls):
-    """Yields all QMetaProperty instances from a given class."""
+@functools.lru_cache(maxsize=None)
+def get_qt_properties(cls) -> Tuple[str, ...]:
+    """Get the names of all designable Qt properties of a given class."""
     meta_obj = cls.staticMetaObject
-    for prop_idx in range(meta_obj.propertyCount()):
-        prop = meta_obj.property(prop_idx)
-        if prop is not None and prop.isDesignable():
-            yield prop.name()
+    return tuple(
+        prop.name()
+        for prop in map(meta_obj.property, range(meta_obj.propertyCount()))
+        if prop is not None and prop.isDesignable()
+    )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_property_descriptors(cls) -> Dict[str, Any]:
+    """
+    Get a mapping of designable Qt property names to the class attribute
+    of the same name, or None if it is not exposed in Python.
+    """
+    return {
+        name: getattr(cls, name, None)
+        for name in get_qt_properties(cls)
+    }
+
+
+@functools.lru_cache(maxsize=512)
 def get_helper_label_text(attr: str) -> str:
-    spaced = re.sub("(PyDM|.)([A-Z])", r"\1 \2", attr)
+    spaced = _CAMEL_CASE_RE.sub(r"\1 \2", attr)
     return spaced.strip().capitalize()
 
 
@@ -329,7 +415,7 @@ class BasicSettingsEditor(QtWidgets.QDialog):
             QtWidgets.QSizePolicy.MinimumExpanding,
         )
 
-        self.property_widgets = []
+        self.property_widgets = ()
         self.setup_ui()
 
     def setup_ui(self):
@@ -350,8 +436,9 @@ class BasicSettingsEditor(QtWidgets.QDialog):
         settings_form.setFieldGrowthPolicy(QtWidgets.QFormLayout.ExpandingFieldsGrow)
         vlayout.addLayout(settings_form)
 
-        for helper_widget in self._create_helper_widgets(settings_form):
-            self.property_widgets.append(helper_widget)
+        self.property_widgets = tuple(
+            self._create_helper_widgets(settings_form)
+        )
 
         buttons_layout = QtWidgets.QHBoxLayout()
         save_btn = QtWidgets.QPushButton("&Save", parent=self)
@@ -367,21 +454,23 @@ class BasicSettingsEditor(QtWidgets.QDialog):
         vlayout.addLayout(buttons_layout)
 
     def _create_helper_widgets(self, settings_form: QtWidgets.QFormLayout):
-        other_attrs = []
-        for attr in sorted(get_qt_properties(type(self.widget))):
-            if attr not in self._common_attributes_ and attr not in other_attrs:
-                other_attrs.append(attr)
+        cls = type(self.widget)
+        properties = _get_property_descriptors(cls)
+        other_attrs = sorted(
+            attr
+            for attr in properties
+            if attr not in self._common_attributes_
+        )
 
-        for attr in list(self._common_attributes_) + other_attrs:
-            prop = getattr(type(self.widget), attr, None)
+        for attr in itertools.chain(self._common_attributes_, other_attrs):
+            prop = properties[attr] if attr in properties else getattr(cls, attr, None)
             if prop is None:
                 continue
 
-            prop_type = getattr(prop, "type", None)
-            helper_widget_cls = self._common_attributes_.get(
-                attr,
-                self._type_to_widget_.get(prop_type, None)
-            )
+            helper_widget_cls = self._common_attributes_.get(attr, None)
+            if helper_widget_cls is None:
+                prop_type = getattr(prop, "type", None)
+                helper_widget_cls = self._type_to_widget_.get(prop_type, None)
             if helper_widget_cls is not None:
                 helper_widget = helper_widget_cls(
                     property_widget=self.widget,